@@ -20,6 +20,7 @@ from tsp_ga_ma import (
     tour_length,
     format_tour,
     exact_tsp_backtracking,
+    exact_tsp_held_karp,
     genetic_tsp,
     memetic_tsp,
 )
@@ -49,6 +50,17 @@ def main():
     print("Exact time (ms):", exact_time_ms)
     print()
 
+    print("=== Exact TSP on G_12_66 (Held-Karp) ===")
+    start_time = time.time()
+    hk_tour, hk_cost, hk_states = exact_tsp_held_karp(dist_matrix_g12)
+    end_time = time.time()
+    hk_time_ms = int((end_time - start_time) * 1000)
+    print("Best cost:", hk_cost)
+    print("Best tour:", format_tour(hk_tour, vertex_labels_g12))
+    print("DP states:", hk_states)
+    print("Held-Karp time (ms):", hk_time_ms)
+    print()
+
     print("=== Genetic Algorithm (GA) ===")
     ga_res = genetic_tsp(
         dist_matrix_g12,
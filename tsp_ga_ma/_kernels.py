@@ -0,0 +1,794 @@
+"""
+Numba-compiled kernels for the hot loops of the solvers.
+
+All kernels work on NumPy arrays only:
+- tours / populations: int32 arrays, one tour per row
+- dist_matrix: 2-D integer array; costs are always accumulated in int64.
+  - tour_cost: C-contiguous int16 or int32 (compiled eagerly for both)
+  - ga_run, held_karp, backtrack_tsp: int32 (see utils.int_dist_matrix)
+  - ma_run and the local-search kernels: any integer dtype; memetic_tsp
+    passes int16 when all distances fit, int32 otherwise
+    (see utils.compact_dist_matrix)
+
+The random numbers drawn inside a kernel come from Numba's own generator,
+which is seeded explicitly so that runs stay reproducible.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Sentinel for "no solution yet" (larger than any real tour cost)
+_INF = np.iinfo(np.int64).max
+
+
+@njit(cache=True)
+def _tour_cost(tour, dist_matrix):
+    """Length of the cycle `tour` (the last vertex connects back to the first)."""
+    n = tour.shape[0]
+    total = np.int64(dist_matrix[tour[n - 1], tour[0]])
+    for i in range(n - 1):
+        total += dist_matrix[tour[i], tour[i + 1]]
+    return total
+
+
+@njit(["int64(int32[::1], int16[:, ::1])",
+       "int64(int32[::1], int32[:, ::1])"], cache=True)
+def tour_cost(tour, dist_matrix):
+    """
+    Length of the cycle `tour`, for a contiguous int32 tour and a contiguous
+    int16 or int32 distance matrix.
+
+    Compiled eagerly for exactly these types, so calls skip type dispatch.
+    It backs the public utils.tour_length, so unlike the solver kernels it
+    checks every vertex against the matrix and raises IndexError, as
+    NumPy indexing would.
+    """
+    num_vertices = dist_matrix.shape[0]
+    for i in range(tour.shape[0]):
+        if tour[i] < 0 or tour[i] >= num_vertices:
+            raise IndexError("tour contains a vertex outside the distance matrix")
+    return _tour_cost(tour, dist_matrix)
+
+
+@njit(parallel=True, cache=True)
+def eval_pop(population, dist_matrix, out):
+    """
+    Write the length of every row of `population` into `out`.
+
+    Rows are independent, so they are spread over all cores with prange.
+    """
+    for r in prange(population.shape[0]):
+        out[r] = _tour_cost(population[r], dist_matrix)
+
+
+@njit(cache=True)
+def _crossover_into(parent1, parent2, point, child, used):
+    """
+    One-point crossover with repair, written into the preallocated `child`.
+
+    child = parent1[:point] + remaining genes from parent2 (in the same order).
+    `used` is a boolean scratch buffer of length n; it is left all False.
+    """
+    n = parent1.shape[0]
+    for k in range(point):
+        child[k] = parent1[k]
+        used[parent1[k]] = True
+    pos = point
+    for k in range(n):
+        g = parent2[k]
+        if not used[g]:
+            child[pos] = g
+            pos += 1
+    for k in range(point):
+        used[parent1[k]] = False
+
+
+@njit(cache=True)
+def crossover_pairs(parents, point, children):
+    """
+    One-point crossover of a whole batch of parents into `children`.
+
+    Parents (0, 1), (2, 3), ... are crossed (an odd last parent is paired
+    with parent 0) and each pair writes two rows of `children`, which must
+    have 2 * ceil(len(parents) / 2) rows. Returns the number of children.
+    """
+    num_parents, n = parents.shape
+    used = np.zeros(n, dtype=np.bool_)
+    num_pairs = num_parents // 2
+    for i in range(0, 2 * num_pairs, 2):
+        _crossover_into(parents[i], parents[i + 1], point, children[i], used)
+        _crossover_into(parents[i + 1], parents[i], point, children[i + 1], used)
+    if num_parents % 2:
+        # Odd count: the last parent is crossed with the first, once
+        last = num_parents - 1
+        _crossover_into(parents[last], parents[0], point, children[last], used)
+        _crossover_into(parents[0], parents[last], point, children[last + 1], used)
+    return 2 * ((num_parents + 1) // 2)
+
+
+@njit(cache=True)
+def _select_best(costs, k, selected):
+    """
+    Write the indices of the `k` smallest `costs` into `selected` in O(len(costs)).
+
+    The k-th smallest value is found with a partition instead of a full
+    sort; ties at that value are taken in index order.
+    """
+    threshold = np.partition(costs, k - 1)[k - 1]
+    m = 0
+    for r in range(costs.shape[0]):
+        if costs[r] < threshold:
+            selected[m] = r
+            m += 1
+    for r in range(costs.shape[0]):
+        if m == k:
+            break
+        if costs[r] == threshold:
+            selected[m] = r
+            m += 1
+
+
+@njit(cache=True)
+def _generation_buffers(population, iterations):
+    """
+    Work buffers of a generation loop, allocated once and reused by every
+    generation: the best half of the population becomes the parents, and
+    they produce 2 * ceil(parents / 2) children.
+
+    Returns:
+        costs, selected, parents, parent_costs, children, mutated, history
+    """
+    size, n = population.shape
+    num_parents = size // 2
+    num_children = 2 * ((num_parents + 1) // 2)
+    costs = np.empty(size, dtype=np.int64)
+    selected = np.empty(num_parents, dtype=np.int64)
+    parents = np.empty((num_parents, n), dtype=population.dtype)
+    parent_costs = np.empty(num_parents, dtype=np.int64)
+    children = np.empty((num_children, n), dtype=population.dtype)
+    mutated = np.empty(num_children, dtype=np.bool_)
+    history = np.empty(iterations, dtype=np.int64)
+    return costs, selected, parents, parent_costs, children, mutated, history
+
+
+@njit(cache=True)
+def _select_parents(population, costs, current_size, selected, parents, parent_costs):
+    """
+    Copy the best half of population[:current_size] into `parents`, best
+    first, with their costs in `parent_costs`.
+
+    Only the selected rows are sorted (stable, ties in index order), so
+    parents are paired by rank as in the paper.
+    """
+    num_parents = parents.shape[0]
+    _select_best(costs[:current_size], num_parents, selected)
+    order = np.argsort(costs[selected], kind="mergesort")
+    for r in range(num_parents):
+        row = selected[order[r]]
+        parents[r] = population[row]
+        parent_costs[r] = costs[row]
+
+
+@njit(cache=True)
+def _swap_mutation(children, mutation_rate, mutated):
+    """
+    Swap mutation: each child (row) is mutated with probability
+    `mutation_rate` by exchanging two distinct random positions.
+
+    `mutated[c]` records whether child c was changed; returns the number
+    of mutated children.
+    """
+    num_children, n = children.shape
+    count = 0
+    for c in range(num_children):
+        mutated[c] = False
+        if np.random.random() < mutation_rate:
+            i = np.random.randint(0, n)
+            j = np.random.randint(0, n - 1)
+            if j >= i:
+                j += 1
+            tmp = children[c, i]
+            children[c, i] = children[c, j]
+            children[c, j] = tmp
+            mutated[c] = True
+            count += 1
+    return count
+
+
+@njit(cache=True)
+def _merge_population(population, costs, parents, parent_costs, children):
+    """
+    Form the new population in place: the parents (with their costs)
+    followed by as many children as fit. Returns the new population size.
+
+    Odd sizes can lose one individual after the first generation, exactly
+    like `parents + children` truncated to the population size.
+    """
+    num_parents = parents.shape[0]
+    current_size = min(population.shape[0], num_parents + children.shape[0])
+    population[:num_parents] = parents
+    population[num_parents:current_size] = children[:current_size - num_parents]
+    costs[:num_parents] = parent_costs
+    return current_size
+
+
+@njit(cache=True)
+def ga_run(dist_matrix, population, iterations, mutation_rate, seed):
+    """
+    Run the GA generation loop (evaluate, select, crossover, mutate).
+
+    `population` is modified in place. A negative `seed` leaves Numba's
+    generator unseeded.
+
+    Returns:
+        best_tour, best_cost, history, crossover_solutions, mutation_solutions
+    """
+    if seed >= 0:
+        np.random.seed(seed)
+
+    size, n = population.shape
+    point = n // 2  # middle crossover point, as in the paper example
+    (costs, selected, parents, parent_costs,
+     children, mutated, history) = _generation_buffers(population, iterations)
+    num_parents = parents.shape[0]
+    current_size = size
+
+    best_tour = population[0].copy()
+    best_cost = _INF
+    crossover_solutions = 0
+    mutation_solutions = 0
+
+    # ---- Step 2: evaluate ----
+    # Only the initial population is evaluated in full; afterwards the
+    # surviving parents keep their costs and only new children are scored
+    eval_pop(population, dist_matrix, costs)
+
+    for it in range(iterations):
+        best_idx = np.argmin(costs[:current_size])
+
+        if costs[best_idx] < best_cost:
+            best_cost = costs[best_idx]
+            best_tour[:] = population[best_idx]
+
+        history[it] = best_cost
+
+        # ---- Step 3: selection (truncate best half) ----
+        _select_parents(population, costs, current_size, selected,
+                        parents, parent_costs)
+
+        # ---- Step 4: crossover ----
+        crossover_solutions += crossover_pairs(parents, point, children)
+
+        # ---- Step 6: swap mutation ----
+        mutation_solutions += _swap_mutation(children, mutation_rate, mutated)
+
+        # ---- Step 7: form new population ----
+        current_size = _merge_population(population, costs, parents,
+                                         parent_costs, children)
+        if it + 1 < iterations:
+            eval_pop(population[num_parents:current_size], dist_matrix,
+                     costs[num_parents:current_size])
+
+    return best_tour, best_cost, history, crossover_solutions, mutation_solutions
+
+
+@njit(cache=True, boundscheck=False)
+def held_karp(dist_matrix):
+    """
+    Held-Karp bitmask dynamic program for the exact TSP (start vertex 0).
+
+    dp[mask, j] is the cheapest path that starts at vertex 0, visits exactly
+    the vertices in `mask` and ends at vertex j. Vertex 0 is fixed as the
+    start, so vertices 1..n-1 are encoded as bits 0..n-2 and the tables
+    have 2**(n-1) rows.
+
+    Returns:
+        best_tour, best_cost
+    """
+    n = dist_matrix.shape[0]
+    m = n - 1
+    size = 1 << m
+
+    # int64 costs: a path of n int32 edges can exceed the int32 range
+    dp = np.full((size, m), _INF, dtype=np.int64)
+    parent = np.full((size, m), -1, dtype=np.int8)
+    for j in range(m):
+        dp[1 << j, j] = dist_matrix[0, j + 1]
+
+    # Every sub-mask is numerically smaller than its mask, so ascending
+    # order fills the predecessors before they are needed
+    for mask in range(1, size):
+        for j in range(m):
+            if not (mask >> j) & 1:
+                continue
+            prev_mask = mask ^ (1 << j)
+            if prev_mask == 0:
+                continue
+            best = _INF
+            best_i = -1
+            for i in range(m):
+                if (prev_mask >> i) & 1 and dp[prev_mask, i] < _INF:
+                    cost = dp[prev_mask, i] + dist_matrix[i + 1, j + 1]
+                    if cost < best:
+                        best = cost
+                        best_i = i
+            dp[mask, j] = best
+            parent[mask, j] = best_i
+
+    # Close the cycle back to vertex 0
+    full = size - 1
+    best_cost = _INF
+    last = 0
+    for j in range(m):
+        cost = dp[full, j] + dist_matrix[j + 1, 0]
+        if cost < best_cost:
+            best_cost = cost
+            last = j
+
+    # Walk the parent table backwards to rebuild the tour
+    tour = np.zeros(n, dtype=np.int32)
+    mask = full
+    j = last
+    for pos in range(n - 1, 0, -1):
+        tour[pos] = j + 1
+        i = parent[mask, j]
+        mask ^= 1 << j
+        j = i
+
+    return tour, best_cost
+
+
+@njit(cache=True)
+def backtrack_tsp(dist_matrix, min_out):
+    """
+    Backtracking + branch-and-bound for the exact TSP (start vertex 0).
+
+    The recursion is unrolled into an explicit stack indexed by depth
+    (number of vertices on the current path): stack_visited, stack_cost and
+    stack_lb hold the visited bitmask, path cost and remaining lower bound
+    of the node at that depth, and stack_next the next candidate vertex
+    to expand. Vertices are expanded in ascending order, and `generated`
+    counts every node entered, exactly like the recursive version.
+
+    Returns:
+        best_tour, best_cost, generated
+    """
+    n = dist_matrix.shape[0]
+    full_mask = (np.int64(1) << n) - 1
+
+    path = np.zeros(n, dtype=np.int32)
+    best_tour = np.zeros(n, dtype=np.int32)
+    best_cost = _INF
+    generated = 0
+
+    stack_visited = np.zeros(n + 1, dtype=np.int64)
+    stack_cost = np.zeros(n + 1, dtype=np.int64)
+    stack_lb = np.zeros(n + 1, dtype=np.int64)
+    stack_next = np.zeros(n + 1, dtype=np.int64)
+
+    # Root: the path [0]
+    depth = 1
+    stack_visited[1] = 1
+    stack_lb[1] = min_out.sum() - min_out[0]
+    entering = True
+
+    while depth > 0:
+        if entering:
+            generated += 1
+            visited = stack_visited[depth]
+            cost = stack_cost[depth]
+
+            # If we have visited all vertices, close the cycle
+            if visited == full_mask:
+                total_cost = cost + dist_matrix[path[depth - 1], 0]
+                if total_cost < best_cost:
+                    best_cost = total_cost
+                    best_tour[:] = path
+                depth -= 1
+                entering = False
+                continue
+
+            # Prune this branch if the optimistic bound is no better
+            if cost + stack_lb[depth] >= best_cost:
+                depth -= 1
+                entering = False
+                continue
+
+            stack_next[depth] = 1
+
+        # Expand the next unvisited vertex of the node at `depth`
+        visited = stack_visited[depth]
+        v = stack_next[depth]
+        while v < n and (visited >> v) & 1:
+            v += 1
+        if v == n:
+            depth -= 1
+            entering = False
+            continue
+        stack_next[depth] = v + 1
+
+        last = path[depth - 1]
+        path[depth] = v
+        stack_visited[depth + 1] = visited | (np.int64(1) << v)
+        stack_cost[depth + 1] = stack_cost[depth] + dist_matrix[last, v]
+        stack_lb[depth + 1] = stack_lb[depth] - min_out[v]
+        depth += 1
+        entering = True
+
+    return best_tour, best_cost, generated
+
+
+@njit(cache=True)
+def _reverse(tour, lo, hi):
+    """Reverse tour[lo:hi] in place."""
+    hi -= 1
+    while lo < hi:
+        tmp = tour[lo]
+        tour[lo] = tour[hi]
+        tour[hi] = tmp
+        lo += 1
+        hi -= 1
+
+
+@njit(cache=True)
+def rotate_groups_pass(tour, dist_matrix, groups, cost):
+    """
+    One pass of the group-rotation local search, applied to `tour` in place.
+
+    `tour` is split into `groups` equal segments, and each segment in turn
+    takes its best cyclic shift (scored in O(1) per shift from the edges
+    it changes). `cost` is the length of `tour`; returns the new length.
+    Tours whose length is not divisible by `groups` are left unchanged.
+    """
+    n = tour.shape[0]
+    if n % groups != 0:
+        return cost
+    group_size = n // groups
+    if group_size < 2 or groups == 1:
+        # Rotating the whole cycle never changes its length
+        return cost
+
+    for g in range(groups):
+        start = g * group_size
+        end = start + group_size
+        prev = tour[start - 1] if start > 0 else tour[n - 1]
+        nxt = tour[end] if end < n else tour[0]
+
+        # Edges of the unshifted group that a shift can change
+        head = tour[start]
+        tail = tour[end - 1]
+        old_cost = (dist_matrix[prev, head] + dist_matrix[tail, nxt]
+                    - dist_matrix[tail, head])
+
+        best_delta = 0
+        best_shift = 0
+        for shift in range(1, group_size):
+            first = tour[start + shift]
+            last = tour[start + shift - 1]
+            delta = (dist_matrix[prev, first] + dist_matrix[last, nxt]
+                     - dist_matrix[last, first]) - old_cost
+            if delta < best_delta:
+                best_delta = delta
+                best_shift = shift
+
+        if best_shift:
+            # Left rotation by best_shift as three in-place reversals
+            _reverse(tour, start, start + best_shift)
+            _reverse(tour, start + best_shift, end)
+            _reverse(tour, start, end)
+            cost += best_delta
+
+    return cost
+
+
+@njit(cache=True)
+def rotate_groups_repeat(tour, dist_matrix, group_counts, cost):
+    """
+    Repeat rotate_groups_pass for every group count in `group_counts` until
+    a full round brings no improvement. Works in place; returns the new cost.
+    """
+    improved = True
+    while improved:
+        improved = False
+        for groups in group_counts:
+            new_cost = rotate_groups_pass(tour, dist_matrix, groups, cost)
+            if new_cost < cost:
+                cost = new_cost
+                improved = True
+    return cost
+
+
+@njit(cache=True)
+def _linked_reverse(succ, pred, first, last):
+    """Reverse the path first..last (following succ) of a linked tour in place."""
+    before = pred[first]
+    after = succ[last]
+    c = first
+    while True:
+        nxt = succ[c]
+        succ[c] = pred[c]
+        pred[c] = nxt
+        if c == last:
+            break
+        c = nxt
+    succ[before] = last
+    pred[last] = before
+    succ[first] = after
+    pred[after] = first
+
+
+@njit(cache=True)
+def _linked_two_opt(succ, pred, u, x):
+    """
+    Replace edges (u, succ[u]) and (x, succ[x]) by (u, x) and
+    (succ[u], succ[x]), reversing whichever of the two paths is shorter.
+    """
+    v = succ[u]
+    y = succ[x]
+    a = v
+    b = y
+    while a != x and b != u:
+        a = succ[a]
+        b = succ[b]
+    if a == x:
+        _linked_reverse(succ, pred, v, x)
+    else:
+        _linked_reverse(succ, pred, y, u)
+
+
+@njit(cache=True)
+def two_opt_search(tour, dist_matrix, neighbors, cost):
+    """
+    2-opt local search on `tour` in place, with neighbor lists and
+    don't-look bits (see local_search.local_search_2opt).
+
+    The tour is handled as succ/pred arrays (succ[v] / pred[v]: vertex
+    visited after / before v) and written back starting from the same
+    vertex. `neighbors[v]` lists the candidate vertices of v, closest
+    first. `cost` is the length of `tour`; returns the new length.
+    """
+    n = tour.shape[0]
+    k = neighbors.shape[1]
+    succ = np.empty(n, dtype=tour.dtype)
+    pred = np.empty(n, dtype=tour.dtype)
+    for i in range(n):
+        a = tour[i]
+        b = tour[i + 1] if i + 1 < n else tour[0]
+        succ[a] = b
+        pred[b] = a
+    dont_look = np.zeros(n, dtype=np.bool_)
+
+    while True:
+        improved = False
+        skipped = False
+        for u in range(n):
+            if dont_look[u]:
+                skipped = True
+                continue
+            found = False
+            moved = True
+            while moved:
+                moved = False
+
+                # Successor side: replace (u, v), (w, z) by (u, w), (v, z)
+                v = succ[u]
+                d_uv = dist_matrix[u, v]
+                for t in range(k):
+                    w = neighbors[u, t]
+                    d_uw = dist_matrix[u, w]
+                    if d_uw >= d_uv:
+                        break
+                    z = succ[w]
+                    if z == u:
+                        continue
+                    delta = d_uw + dist_matrix[v, z] - d_uv - dist_matrix[w, z]
+                    if delta < 0:
+                        cost += delta
+                        _linked_two_opt(succ, pred, u, w)
+                        dont_look[v] = False
+                        dont_look[w] = False
+                        dont_look[z] = False
+                        moved = True
+                        break
+                if moved:
+                    found = True
+                    improved = True
+                    continue
+
+                # Predecessor side: replace (p, u), (z, w) by (u, w), (p, z)
+                p = pred[u]
+                d_pu = dist_matrix[u, p]
+                for t in range(k):
+                    w = neighbors[u, t]
+                    d_uw = dist_matrix[u, w]
+                    if d_uw >= d_pu:
+                        break
+                    z = pred[w]
+                    if z == u:
+                        continue
+                    delta = d_uw + dist_matrix[p, z] - d_pu - dist_matrix[z, w]
+                    if delta < 0:
+                        cost += delta
+                        _linked_two_opt(succ, pred, z, p)
+                        dont_look[p] = False
+                        dont_look[w] = False
+                        dont_look[z] = False
+                        moved = True
+                        break
+                if moved:
+                    found = True
+                    improved = True
+
+            if not found:
+                dont_look[u] = True
+
+        if not improved:
+            if not skipped:
+                break
+            # Confirm the local optimum with one pass that skips nothing
+            dont_look[:] = False
+
+    v = tour[0]
+    for i in range(n):
+        tour[i] = v
+        v = succ[v]
+    return cost
+
+
+# Local search methods of the MA kernels
+LS_ROTATE = 0         # one rotate_groups_pass per group count
+LS_ROTATE_REPEAT = 1  # rotate_groups_repeat
+LS_2OPT = 2           # two_opt_search
+
+
+@njit(parallel=True, cache=True)
+def local_search_rows(children, costs, rows, dist_matrix, ls_kind, group_counts, neighbors):
+    """
+    Local search on the rows `rows` of `children`, in parallel.
+
+    `ls_kind` is one of LS_ROTATE, LS_ROTATE_REPEAT (both use
+    `group_counts`) or LS_2OPT (uses `neighbors`). The resulting length
+    of every listed row is written into `costs`.
+    """
+    for t in prange(rows.shape[0]):
+        r = rows[t]
+        tour = children[r]
+        cost = _tour_cost(tour, dist_matrix)
+        if ls_kind == LS_2OPT:
+            cost = two_opt_search(tour, dist_matrix, neighbors, cost)
+        elif ls_kind == LS_ROTATE_REPEAT:
+            cost = rotate_groups_repeat(tour, dist_matrix, group_counts, cost)
+        else:
+            for groups in group_counts:
+                cost = rotate_groups_pass(tour, dist_matrix, groups, cost)
+        costs[r] = cost
+
+
+# Local-search memo slots per child of a generation (rounded up to a power of 2)
+_LS_MEMO_FACTOR = 4
+
+
+@njit(cache=True)
+def _tour_hash(tour):
+    """64-bit FNV-1a style hash of a tour (wraps around on overflow)."""
+    h = np.int64(-3750763034362895579)
+    for i in range(tour.shape[0]):
+        h = (h ^ tour[i]) * np.int64(1099511628211)
+    return h
+
+
+@njit(cache=True)
+def _same_tour(a, b):
+    """True if tours `a` and `b` are identical, position by position."""
+    for i in range(a.shape[0]):
+        if a[i] != b[i]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def ma_run(dist_matrix, population, iterations, mutation_rate, local_search_prob,
+           ls_kind, group_counts, neighbors, seed):
+    """
+    Run the MA generation loop (select, crossover, local search, mutate).
+
+    Same structure as the GA loop, with local_search_rows applied to each
+    child with probability `local_search_prob` before mutation.
+    `population` is modified in place. A negative `seed` leaves Numba's
+    generator unseeded.
+
+    Returns:
+        best_tour, best_cost, history, crossover_solutions, mutation_solutions
+    """
+    if seed >= 0:
+        np.random.seed(seed)
+
+    size, n = population.shape
+    point = n // 2
+    (costs, selected, parents, parent_costs,
+     children, mutated, history) = _generation_buffers(population, iterations)
+    num_parents = parents.shape[0]
+    num_children = children.shape[0]
+    current_size = size
+
+    child_costs = np.empty(num_children, dtype=np.int64)
+    known = np.empty(num_children, dtype=np.bool_)
+    ls_rows = np.empty(num_children, dtype=np.int64)
+    ls_slots = np.empty(num_children, dtype=np.int64)
+    ls_inputs = np.empty((num_children, n), dtype=population.dtype)
+
+    # Direct-mapped memo of local-search results (input tour -> output
+    # tour and cost), indexed by tour hash; a new entry evicts the old one
+    memo_size = 1
+    while memo_size < _LS_MEMO_FACTOR * num_children:
+        memo_size *= 2
+    memo_in = np.empty((memo_size, n), dtype=population.dtype)
+    memo_out = np.empty((memo_size, n), dtype=population.dtype)
+    memo_cost = np.empty(memo_size, dtype=np.int64)
+    memo_valid = np.zeros(memo_size, dtype=np.bool_)
+
+    best_tour = population[0].copy()
+    best_cost = _INF
+    crossover_solutions = 0
+    mutation_solutions = 0
+
+    # Costs are kept alongside the population: survivors keep theirs and
+    # local search reports the cost of the tour it returns, so only
+    # children with an unknown cost need a full evaluation
+    eval_pop(population, dist_matrix, costs)
+
+    for it in range(iterations):
+        # ---- Selection: the best half, best first ----
+        _select_parents(population, costs, current_size, selected,
+                        parents, parent_costs)
+
+        if parent_costs[0] < best_cost:
+            best_cost = parent_costs[0]
+            best_tour[:] = parents[0]
+
+        history[it] = best_cost
+
+        # ---- Crossover ----
+        crossover_solutions += crossover_pairs(parents, point, children)
+
+        # ---- Local search on the children drawn for it ----
+        # Local search is deterministic, so a child already refined in an
+        # earlier generation just takes the memoized result
+        num_ls = 0
+        for c in range(num_children):
+            known[c] = np.random.random() < local_search_prob
+            if not known[c]:
+                continue
+            slot = _tour_hash(children[c]) & (memo_size - 1)
+            if memo_valid[slot] and _same_tour(memo_in[slot], children[c]):
+                children[c] = memo_out[slot]
+                child_costs[c] = memo_cost[slot]
+            else:
+                ls_rows[num_ls] = c
+                ls_slots[num_ls] = slot
+                ls_inputs[num_ls] = children[c]
+                num_ls += 1
+        if num_ls:
+            local_search_rows(children, child_costs, ls_rows[:num_ls], dist_matrix,
+                              ls_kind, group_counts, neighbors)
+            for t in range(num_ls):
+                slot = ls_slots[t]
+                memo_in[slot] = ls_inputs[t]
+                memo_out[slot] = children[ls_rows[t]]
+                memo_cost[slot] = child_costs[ls_rows[t]]
+                memo_valid[slot] = True
+
+        # ---- Swap mutation ----
+        mutation_solutions += _swap_mutation(children, mutation_rate, mutated)
+
+        # Evaluate only the children whose cost is not known yet
+        for c in range(num_children):
+            if mutated[c] or not known[c]:
+                child_costs[c] = _tour_cost(children[c], dist_matrix)
+
+        # ---- New population: parents followed by children ----
+        current_size = _merge_population(population, costs, parents,
+                                         parent_costs, children)
+        costs[num_parents:current_size] = child_costs[:current_size - num_parents]
+
+    return best_tour, best_cost, history, crossover_solutions, mutation_solutions
@@ -7,14 +7,16 @@ from the paper (Figure 1 and Table 1).
 
 from typing import List
 
+import numpy as np
+
 # Vertex labels as in the paper: a, b, c, d, e, f, g, h, i, j, k, l
 vertex_labels_g12: List[str] = [
     "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l"
 ]
 
 # Distance matrix (Table 1 in the paper)
-# dist_matrix_g12[i][j] is the cost between vertex i and j
-dist_matrix_g12: List[List[int]] = [
+# dist_matrix_g12[i, j] is the cost between vertex i and j
+dist_matrix_g12: np.ndarray = np.array([
     [0,   112, 269, 269, 300, 403, 381, 391, 200, 100, 212, 447],
     [112,   0, 200, 158, 206, 300, 269, 283, 112, 112, 112, 335],
     [269, 200,   0, 212, 320, 361, 269, 200, 269, 180, 112, 304],
@@ -27,4 +29,4 @@ dist_matrix_g12: List[List[int]] = [
     [100, 112, 180, 250, 316, 403, 354, 335, 224,   0, 158, 412],
     [212, 112, 112, 112, 212, 269, 200, 180, 158, 158,   0, 255],
     [447, 335, 304, 180, 224, 150,  71, 112, 283, 412, 255,   0],
-]
+], dtype=np.int32)
@@ -1,13 +1,17 @@
 """
-Exact TSP solver using backtracking + branch-and-bound.
+Exact TSP solvers.
 
-This is used as a reference solution for small graphs (e.g. the 12-vertex graph
+- backtracking + branch-and-bound (the method used in the paper)
+- Held-Karp bitmask dynamic programming, O(n^2 * 2^n)
+
+These are used as reference solutions for small graphs (e.g. the 12-vertex graph
 G_12_66 from the paper).
 """
 
 from typing import List, Tuple
-import math
-from .utils import tour_length
+import numpy as np
+from .utils import int_dist_matrix
+from ._kernels import backtrack_tsp, held_karp
 
 
 def exact_tsp_backtracking(dist_matrix) -> Tuple[List[int], int, int]:
@@ -16,60 +20,51 @@ def exact_tsp_backtracking(dist_matrix) -> Tuple[List[int], int, int]:
 
     We fix the starting vertex as 0 and explore all permutations of the
     remaining vertices, pruning branches when the optimistic lower bound
-    exceeds the current best cost.
+    exceeds the current best cost. The distance matrix is converted to a
+    contiguous int32 array (see utils.int_dist_matrix) and the search runs
+    as an iterative Numba kernel (visited sets are 64-bit masks, so n is
+    limited to 62).
 
     Returns:
         best_tour: list of vertex indices representing the best cycle
         best_cost: optimal cost
         generated: number of partial/complete solutions visited
     """
+    dist_matrix = int_dist_matrix(dist_matrix)
     n = len(dist_matrix)
-    best_tour = None
-    best_cost = math.inf
-    visited = [False] * n
-    visited[0] = True
-    current_path: List[int] = [0]
-    generated = 0
+    if n > 62:
+        raise ValueError("exact_tsp_backtracking supports at most 62 vertices")
 
     # Pre-compute a minimal outgoing edge cost for each vertex
-    min_out = []
-    for i in range(n):
-        row = dist_matrix[i]
-        min_val = min(row[j] for j in range(n) if j != i)
-        min_out.append(min_val)
-
-    def backtrack(last: int, depth: int, current_cost: int):
-        nonlocal best_tour, best_cost, generated
+    # (the diagonal is masked out so a vertex never counts its self-loop)
+    no_self = np.where(np.eye(n, dtype=bool), np.iinfo(np.int32).max, dist_matrix)
+    min_out = no_self.min(axis=1).astype(np.int64)
 
-        generated += 1
+    best_tour, best_cost, generated = backtrack_tsp(dist_matrix, min_out)
+    return best_tour.tolist(), int(best_cost), int(generated)
 
-        # If we have visited all vertices, close the cycle
-        if depth == n:
-            total_cost = current_cost + dist_matrix[last][0]
-            if total_cost < best_cost:
-                best_cost = total_cost
-                best_tour = current_path.copy()
-            return
 
-        # Compute a simple optimistic lower bound:
-        # current_cost + sum of minimal outgoing edges for unvisited vertices
-        remaining_lower_bound = 0
-        for v in range(n):
-            if not visited[v]:
-                remaining_lower_bound += min_out[v]
+def exact_tsp_held_karp(dist_matrix) -> Tuple[List[int], int, int]:
+    """
+    Solve TSP exactly using the Held-Karp bitmask dynamic program.
 
-        if current_cost + remaining_lower_bound >= best_cost:
-            # Prune this branch
-            return
+    The DP table has 2^(n-1) * (n-1) entries, so this is intended for
+    graphs with up to about 20 vertices; more than 24 (where the tables
+    already take about 1.7 GB) raise ValueError. The distance matrix is
+    converted to a contiguous int32 array (see utils.int_dist_matrix).
 
-        # Try all unvisited vertices
-        for v in range(1, n):
-            if not visited[v]:
-                visited[v] = True
-                current_path.append(v)
-                backtrack(v, depth + 1, current_cost + dist_matrix[last][v])
-                current_path.pop()
-                visited[v] = False
+    Returns:
+        best_tour: list of vertex indices representing the best cycle
+        best_cost: optimal cost
+        generated: number of DP states (subset, last vertex) evaluated
+    """
+    dist_matrix = int_dist_matrix(dist_matrix)
+    n = len(dist_matrix)
+    if n > 24:
+        raise ValueError("exact_tsp_held_karp supports at most 24 vertices")
+    if n == 1:
+        return [0], 0, 1
 
-    backtrack(0, 1, 0)
-    return best_tour, best_cost, generated
+    best_tour, best_cost = held_karp(dist_matrix)
+    generated = (n - 1) * (1 << (n - 2))
+    return best_tour.tolist(), int(best_cost), generated
@@ -7,17 +7,23 @@ This follows the high-level idea in the paper:
 - selection: truncation (keep best half)
 - crossover: one-point crossover with repair to ensure valid permutations
 - mutation: swap mutation
+
+The generation loop of `genetic_tsp` runs as a single Numba kernel
+(see _kernels.py); the Python operators below are kept as the public
+single-call versions of its crossover and mutation.
 """
 
-from typing import List, Dict
+from typing import Dict
 import random
 import time
-from .utils import tour_length
+import numpy as np
+from .utils import int_dist_matrix, kernel_seed
+from ._kernels import ga_run
 
 
-def crossover_one_point(parent1: List[int],
-                        parent2: List[int],
-                        point: int) -> (List[int], List[int]):
+def crossover_one_point(parent1: np.ndarray,
+                        parent2: np.ndarray,
+                        point: int) -> (np.ndarray, np.ndarray):
     """
     One-point crossover with simple repair: generate two valid children.
 
@@ -25,23 +31,35 @@ def crossover_one_point(parent1: List[int],
     child2 = parent2[:point] + remaining genes from parent1 (in the same order)
 
     This ensures each city appears exactly once in the permutation.
+    The genes already taken from the first parent are tracked as bits of
+    an integer bitmap, so the repair needs no per-call set. Parents may be
+    lists or arrays; the children are returned as arrays.
     """
-    n = len(parent1)
+    parent1 = np.asarray(parent1)
+    parent2 = np.asarray(parent2)
+    genes1 = parent1.tolist()
+    genes2 = parent2.tolist()
 
     # Child 1
-    child1_first = parent1[:point]
-    used1 = set(child1_first)
-    child1 = child1_first + [g for g in parent2 if g not in used1]
+    child1_first = genes1[:point]
+    used1 = 0
+    for g in child1_first:
+        used1 |= 1 << g
+    child1 = child1_first + [g for g in genes2 if not (used1 >> g) & 1]
 
     # Child 2
-    child2_first = parent2[:point]
-    used2 = set(child2_first)
-    child2 = child2_first + [g for g in parent1 if g not in used2]
-
+    child2_first = genes2[:point]
+    used2 = 0
+    for g in child2_first:
+        used2 |= 1 << g
+    child2 = child2_first + [g for g in genes1 if not (used2 >> g) & 1]
+
+    child1 = np.array(child1, dtype=parent1.dtype)
+    child2 = np.array(child2, dtype=parent2.dtype)
     return child1, child2
 
 
-def mutate_swap(tour: List[int]) -> None:
+def mutate_swap(tour: np.ndarray) -> None:
     """
     Simple swap mutation: randomly exchange two positions in the tour.
     """
@@ -63,7 +81,10 @@ def genetic_tsp(dist_matrix,
         population_size: number of individuals in the population
         iterations: number of generations
         mutation_rate: probability of mutating each offspring
-        seed: optional random seed
+        seed: optional random seed, 0 <= seed < 2**32
+
+    The distance matrix is converted to a contiguous int32 array;
+    non-integer distances raise ValueError (see utils.int_dist_matrix).
 
     Returns:
         A dict containing:
@@ -71,74 +92,45 @@ def genetic_tsp(dist_matrix,
             crossover_solutions, mutation_solutions,
             total_solutions, time_ms
     """
-    if seed is not None:
-        random.seed(seed)
+    if population_size < 2:
+        raise ValueError("population_size must be at least 2")
 
+    dist_matrix = int_dist_matrix(dist_matrix)
     n = len(dist_matrix)
+    numba_seed = kernel_seed(seed)
+    rng = np.random.default_rng(seed)
 
     # ---- Step 1: initialize population ----
-    population: List[List[int]] = []
-    for _ in range(population_size):
-        tour = list(range(n))
-        random.shuffle(tour)
-        population.append(tour)
+    # One tour per row of a contiguous (population_size, n) int32 array,
+    # each row shuffled independently in a single call
+    population = np.tile(np.arange(n, dtype=np.int32), (population_size, 1))
+    rng.permuted(population, axis=1, out=population)
 
-    def fitness(t: List[int]) -> int:
-        return tour_length(t, dist_matrix)
+    # Compile the kernel (or load it from Numba's cache) before timing:
+    # a run of zero generations has the same argument types and leaves
+    # `population` untouched
+    ga_run(dist_matrix, population, 0, mutation_rate, -1)
 
     start_time = time.time()
 
-    best_tour = None
-    best_cost = float("inf")
-
-    crossover_solutions = 0
-    mutation_solutions = 0
-
-    history: List[int] = []
-
-    for _ in range(iterations):
-        # ---- Step 2: evaluate and sort ----
-        population.sort(key=fitness)
-        current_best = population[0]
-        current_cost = fitness(current_best)
-
-        if current_cost < best_cost:
-            best_cost = current_cost
-            best_tour = current_best.copy()
-
-        history.append(best_cost)
-
-        # ---- Step 3: selection (truncate best half) ----
-        parents = population[: population_size // 2]
-
-        # ---- Step 4: crossover ----
-        new_children: List[List[int]] = []
-        for i in range(0, len(parents), 2):
-            p1 = parents[i]
-            p2 = parents[(i + 1) % len(parents)]
-            point = n // 2  # middle crossover point, as in the paper example
-            c1, c2 = crossover_one_point(p1, p2, point)
-            new_children.extend([c1, c2])
-            crossover_solutions += 2
-
-        # ---- Step 6: mutation ----
-        for child in new_children:
-            if random.random() < mutation_rate:
-                mutate_swap(child)
-                mutation_solutions += 1
-
-        # ---- Step 7: form new population ----
-        population = parents + new_children
-        population = population[:population_size]
+    # ---- Steps 2-7: generation loop, compiled with Numba ----
+    (best_tour, best_cost, history,
+     crossover_solutions, mutation_solutions) = ga_run(
+        dist_matrix,
+        population,
+        iterations,
+        mutation_rate,
+        numba_seed,
+    )
 
     end_time = time.time()
     time_ms = int((end_time - start_time) * 1000)
     total_solutions = crossover_solutions + mutation_solutions
 
     return {
-        "best_tour": best_tour,
-        "best_cost": best_cost,
-        "history": history,
+        "best_tour": best_tour.tolist() if iterations > 0 else None,
+        "best_cost": int(best_cost) if iterations > 0 else float("inf"),
+        "history": history.tolist(),
         "crossover_solutions": crossover_solutions,
         "mutation_solutions": mutation_solutions,
         "total_solutions": total_solutions,
@@ -4,17 +4,24 @@ Local search method used inside the Memetic Algorithm (MA).
 The idea follows the paper:
 - Split a tour into equal-length groups (e.g., 3 groups for 12 vertices)
 - For each group, try all cyclic shifts
-- Evaluate the full tour for each shifted group
+- Evaluate the full tour for each shifted group (as a cost delta: only the
+  edges touching the group change)
 - Keep the best shift that improves (or keeps) the current best cost
+
+Every function returns the resulting tour and its length; the length is
+an int for integer distance matrices and a float for float ones.
 """
 
-from typing import List
-from .utils import tour_length
+from typing import List, Tuple
+import numpy as np
+from .utils import DEFAULT_NEIGHBORS, nearest_neighbors, tour_length
+from ._kernels import rotate_groups_pass, rotate_groups_repeat, two_opt_search
 
 
-def local_search_rotate_groups(tour: List[int],
+def local_search_rotate_groups(tour: np.ndarray,
                                dist_matrix,
-                               groups: int = 3) -> List[int]:
+                               groups: int = 3,
+                               start_cost: int | None = None) -> Tuple[np.ndarray, int]:
     """
     Perform local search by rotating each group in the tour.
 
@@ -27,124 +34,99 @@ def local_search_rotate_groups(tour: List[int],
 
     This procedure never worsens the current solution: it either returns a
     strictly better tour or the same one.
+
+    A cyclic shift by `s` of a group g[0..m-1] only drops the internal edge
+    (g[s-1], g[s]), adds back the closing edge (g[m-1], g[0]) and changes the
+    two boundary edges, so each shift is scored in O(1) without building
+    the candidate tour.
+
+    `start_cost` is the length of `tour` if the caller already knows it
+    (otherwise it is computed). Returns the resulting tour and its length.
+    The search itself runs as the Numba kernel _kernels.rotate_groups_pass
+    on a copy of `tour`.
     """
-    n = len(tour)
-    if n % groups != 0:
-        # For simplicity, only handle equal-sized groups
-        return tour
-
-    group_size = n // groups
-    best_tour = tour.copy()
-    best_cost = tour_length(best_tour, dist_matrix)
-
-    # Process each group in sequence
-    for g in range(groups):
-        start = g * group_size
-        end = start + group_size
-
-        group = best_tour[start:end]
-        current_group_best = group.copy()
-        current_group_best_cost = best_cost
-
-        # Try all cyclic shifts of this group
-        for shift in range(1, group_size):
-            rotated = group[shift:] + group[:shift]
-            candidate = best_tour.copy()
-            candidate[start:end] = rotated
-            cost = tour_length(candidate, dist_matrix)
-            if cost < current_group_best_cost:
-                current_group_best_cost = cost
-                current_group_best = rotated
-
-        # Fix the best rotation for this group
-        best_tour[start:end] = current_group_best
-        best_cost = current_group_best_cost
-
-    return best_tour
-
-
-def local_search_2opt(tour: List[int], dist_matrix) -> List[int]:
+    best_tour = np.array(tour, dtype=np.int32)
+    dist_matrix = np.asarray(dist_matrix)
+    if start_cost is None:
+        start_cost = tour_length(best_tour, dist_matrix)
+    best_cost = rotate_groups_pass(best_tour, dist_matrix, groups, start_cost)
+    return best_tour, best_cost
+
+
+def local_search_2opt(tour: np.ndarray,
+                      dist_matrix,
+                      start_cost: int | None = None,
+                      neighbors: np.ndarray | None = None) -> Tuple[np.ndarray, int]:
     """
     Perform 2-opt local search.
     Iteratively reverse segments of the tour to reduce length.
-    """
-    n = len(tour)
-    best_tour = tour.copy()
-    improved = True
-
-    while improved:
-        improved = False
-        for i in range(n - 1):
-            for j in range(i + 2, n):
-                # Skip if j is the last node and i is the first (edge (n-1, 0) and (0, 1) are adjacent)
-                if i == 0 and j == n - 1:
-                    continue
-
-                u, v = best_tour[i], best_tour[i + 1]
-                x, y = best_tour[j], best_tour[(j + 1) % n]
 
-                delta = -dist_matrix[u][v] - dist_matrix[x][y] + dist_matrix[u][x] + dist_matrix[v][y]
-
-                if delta < 0:
-                    best_tour[i + 1 : j + 1] = reversed(best_tour[i + 1 : j + 1])
-                    improved = True
-                    # Restart search after improvement (First Improvement)
-                    # break
-            # if improved: break
-
-    return best_tour
+    The tour is held as successor / predecessor arrays indexed by vertex,
+    so each move only reverses the shorter side of the tour. Candidate
+    moves come from a nearest-neighbor list: an improving move adds an
+    edge (u, w) shorter than one of the two tour edges at u, so for every
+    vertex u only neighbors w closer than next(u) (resp. prev(u)) are
+    tried, closest first, and the scan stops at the first neighbor that is
+    not. Two more speed-ups are used:
+    - "don't look bits": a vertex whose scan found no improving move is
+      skipped until one of its incident edges changes. A final pass without
+      skipping confirms the local optimum;
+    - `neighbors` (see utils.nearest_neighbors) can be built once per
+      distance matrix and shared between calls; by default the
+      DEFAULT_NEIGHBORS nearest neighbors are used. With n - 1 neighbors the
+      result is 2-opt optimal.
+
+    `start_cost` is the length of `tour` if already known. Returns the
+    resulting tour (starting at the same vertex) and its length (kept up to
+    date from the move deltas).
+    The search runs as the Numba kernel _kernels.two_opt_search on a copy
+    of `tour`.
+    """
+    best_tour = np.array(tour, dtype=np.int32)
+    dist_matrix = np.asarray(dist_matrix)
+    if start_cost is None:
+        start_cost = tour_length(best_tour, dist_matrix)
+    if neighbors is None:
+        neighbors = nearest_neighbors(dist_matrix, DEFAULT_NEIGHBORS)
+    best_cost = two_opt_search(best_tour, dist_matrix, neighbors, start_cost)
+    return best_tour, best_cost
 
 
-def local_search_rotate_groups_iterative(tour: List[int],
+def local_search_rotate_groups_iterative(tour: np.ndarray,
                                          dist_matrix,
-                                         groups: int = 3) -> List[int]:
+                                         groups: int = 3,
+                                         start_cost: int | None = None) -> Tuple[np.ndarray, int]:
     """
     Perform local search by rotating each group in the tour iteratively until no improvement.
+    Returns the resulting tour and its length.
     """
-    current_tour = tour.copy()
-    current_cost = tour_length(current_tour, dist_matrix)
-    
-    while True:
-        # Perform one pass of group rotations
-        new_tour = local_search_rotate_groups(current_tour, dist_matrix, groups)
-        new_cost = tour_length(new_tour, dist_matrix)
-        
-        if new_cost < current_cost:
-            current_tour = new_tour
-            current_cost = new_cost
-        else:
-            # No improvement in this full pass
-            break
-            
-    return current_tour
-
-
-def local_search_rotate_groups_dynamic(tour: List[int],
+    current_tour = np.array(tour, dtype=np.int32)
+    dist_matrix = np.asarray(dist_matrix)
+    current_cost = tour_length(current_tour, dist_matrix) if start_cost is None else start_cost
+
+    # Passes are repeated inside the kernel until one brings no improvement
+    current_cost = rotate_groups_repeat(current_tour, dist_matrix,
+                                        np.array([groups], dtype=np.int64), current_cost)
+    return current_tour, current_cost
+
+
+def local_search_rotate_groups_dynamic(tour: np.ndarray,
                                        dist_matrix,
-                                       group_sizes: List[int] = [3, 4]) -> List[int]:
+                                       group_sizes: List[int] = [3, 4],
+                                       start_cost: int | None = None) -> Tuple[np.ndarray, int]:
     """
     Perform local search by rotating groups with dynamic sizes.
     It iterates through the list of group counts provided in `group_sizes`.
     For each group count, it performs the rotation search.
     This process repeats until no improvement is found across all group sizes.
+    Returns the resulting tour and its length.
     """
-    current_tour = tour.copy()
-    current_cost = tour_length(current_tour, dist_matrix)
-    
-    while True:
-        improved_in_cycle = False
-        
-        for groups in group_sizes:
-            # Perform one pass of group rotations with current group count
-            new_tour = local_search_rotate_groups(current_tour, dist_matrix, groups)
-            new_cost = tour_length(new_tour, dist_matrix)
-            
-            if new_cost < current_cost:
-                current_tour = new_tour
-                current_cost = new_cost
-                improved_in_cycle = True
-        
-        if not improved_in_cycle:
-            break
-            
-    return current_tour
+    current_tour = np.array(tour, dtype=np.int32)
+    dist_matrix = np.asarray(dist_matrix)
+    current_cost = tour_length(current_tour, dist_matrix) if start_cost is None else start_cost
+
+    # One pass per group count, repeated inside the kernel until a full
+    # round brings no improvement
+    current_cost = rotate_groups_repeat(current_tour, dist_matrix,
+                                        np.asarray(group_sizes, dtype=np.int64), current_cost)
+    return current_tour, current_cost
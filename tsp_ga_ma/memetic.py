@@ -5,15 +5,16 @@ This is essentially:
     Genetic Algorithm + local search.
 
 We use the same GA structure as in ga.py, but after crossover we apply
-local search on (some or all) offspring to refine them.
+local search on (some or all) offspring to refine them. As in the GA, the
+generation loop runs as a single Numba kernel (see _kernels.ma_run).
 """
 
-from typing import List, Dict
-import random
+from typing import Dict
 import time
-from .utils import tour_length
-from .ga import crossover_one_point, mutate_swap
-from .local_search import local_search_rotate_groups, local_search_2opt, local_search_rotate_groups_iterative, local_search_rotate_groups_dynamic
+import numpy as np
+from .utils import (DEFAULT_NEIGHBORS, compact_dist_matrix, greedy_nn_tour,
+                    kernel_seed, nearest_neighbors)
+from ._kernels import LS_2OPT, LS_ROTATE, LS_ROTATE_REPEAT, ma_run
 
 
 def memetic_tsp(dist_matrix,
@@ -35,7 +36,12 @@ def memetic_tsp(dist_matrix,
         local_search_prob: probability of applying local search to each offspring
         groups_for_ls: number of groups for the local search procedure (used if ls_method="rotate")
         ls_method: local search method to use ("rotate" or "2opt")
-        seed: optional random seed
+        seed: optional random seed, 0 <= seed < 2**32
+
+    The distance matrix is converted to a contiguous int16 array when all
+    distances fit, int32 otherwise (see utils.compact_dist_matrix).
+    Randomness during the generation loop comes from Numba's generator,
+    seeded with `seed`.
 
     Returns:
         A dict containing:
@@ -43,97 +49,70 @@ def memetic_tsp(dist_matrix,
             crossover_solutions, mutation_solutions,
             total_solutions, time_ms
     """
-    if seed is not None:
-        random.seed(seed)
+    if population_size < 2:
+        raise ValueError("population_size must be at least 2")
 
+    dist_matrix = compact_dist_matrix(dist_matrix)
     n = len(dist_matrix)
-
-    # Initialize population
-    population: List[List[int]] = []
-    for _ in range(population_size):
-        tour = list(range(n))
-        random.shuffle(tour)
-        population.append(tour)
-
-    def fitness(t: List[int]) -> int:
-        return tour_length(t, dist_matrix)
+    numba_seed = kernel_seed(seed)
+    rng = np.random.default_rng(seed)
+
+    # 2-opt candidate lists depend only on the distance matrix
+    if ls_method == "2opt":
+        ls_kind = LS_2OPT
+        neighbors = nearest_neighbors(dist_matrix, DEFAULT_NEIGHBORS)
+    else:
+        # "rotate_iterative" and "rotate_dynamic" repeat the passes until
+        # no improvement
+        if ls_method in ("rotate_iterative", "rotate_dynamic"):
+            ls_kind = LS_ROTATE_REPEAT
+        else:
+            ls_kind = LS_ROTATE
+        neighbors = np.empty((n, 0), dtype=np.int32)
+    if ls_method == "rotate_dynamic":
+        group_counts = np.array([3, 4], dtype=np.int64)  # Hardcoded for G12 (12 vertices: 3x4 and 4x3)
+    else:
+        group_counts = np.array([groups_for_ls], dtype=np.int64)
+
+    # Initialize population (one tour per row): half greedy nearest-neighbor
+    # tours from distinct random starts, the rest random for diversity
+    population = np.empty((population_size, n), dtype=np.int32)
+    num_greedy = min(population_size // 2, n)
+    for k, start in enumerate(rng.choice(n, size=num_greedy, replace=False)):
+        population[k] = greedy_nn_tour(dist_matrix, start)
+    # Remaining rows: independent random permutations, all at once as the
+    # argsort of random keys (float64, so ties are practically impossible)
+    population[num_greedy:] = np.argsort(rng.random((population_size - num_greedy, n)), axis=1)
+
+    # Compile / load the kernel before timing, as in genetic_tsp
+    ma_run(dist_matrix, population, 0, mutation_rate, local_search_prob,
+           ls_kind, group_counts, neighbors, -1)
 
     start_time = time.time()
 
-    best_tour = None
-    best_cost = float("inf")
-
-    crossover_solutions = 0
-    mutation_solutions = 0
-
-    history: List[int] = []
-
-    for _ in range(iterations):
-        population.sort(key=fitness)
-        current_best = population[0]
-        current_cost = fitness(current_best)
-
-        if current_cost < best_cost:
-            best_cost = current_cost
-            best_tour = current_best.copy()
-
-        history.append(best_cost)
-
-        parents = population[: population_size // 2]
-
-        new_children: List[List[int]] = []
-        for i in range(0, len(parents), 2):
-            p1 = parents[i]
-            p2 = parents[(i + 1) % len(parents)]
-            point = n // 2
-            c1, c2 = crossover_one_point(p1, p2, point)
-            crossover_solutions += 2
-            new_children.extend([c1, c2])
-
-        # Local search (Step 7.1 in the paper)
-        for i in range(len(new_children)):
-            if random.random() < local_search_prob:
-                if ls_method == "2opt":
-                    new_children[i] = local_search_2opt(
-                        new_children[i],
-                        dist_matrix
-                    )
-                elif ls_method == "rotate_iterative":
-                    new_children[i] = local_search_rotate_groups_iterative(
-                        new_children[i],
-                        dist_matrix,
-                        groups=groups_for_ls
-                    )
-                elif ls_method == "rotate_dynamic":
-                    new_children[i] = local_search_rotate_groups_dynamic(
-                        new_children[i],
-                        dist_matrix,
-                        group_sizes=[3, 4] # Hardcoded for G12 (12 vertices: 3x4 and 4x3)
-                    )
-                else:
-                    new_children[i] = local_search_rotate_groups(
-                        new_children[i],
-                        dist_matrix,
-                        groups=groups_for_ls
-                    )
-
-        # Mutation
-        for child in new_children:
-            if random.random() < mutation_rate:
-                mutate_swap(child)
-                mutation_solutions += 1
-
-        population = parents + new_children
-        population = population[:population_size]
+    # Generation loop (selection, crossover, local search, mutation),
+    # compiled with Numba
+    (best_tour, best_cost, history,
+     crossover_solutions, mutation_solutions) = ma_run(
+        dist_matrix,
+        population,
+        iterations,
+        mutation_rate,
+        local_search_prob,
+        ls_kind,
+        group_counts,
+        neighbors,
+        numba_seed,
+    )
 
     end_time = time.time()
     time_ms = int((end_time - start_time) * 1000)
     total_solutions = crossover_solutions + mutation_solutions
 
     return {
-        "best_tour": best_tour,
-        "best_cost": best_cost,
-        "history": history,
+        "best_tour": best_tour.tolist() if iterations > 0 else None,
+        "best_cost": int(best_cost) if iterations > 0 else float("inf"),
+        "history": history.tolist(),
         "crossover_solutions": crossover_solutions,
         "mutation_solutions": mutation_solutions,
         "total_solutions": total_solutions,
@@ -2,28 +2,142 @@
 Utility functions for TSP tours.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+import numpy as np
 from .data import vertex_labels_g12
+from ._kernels import tour_cost
+
+# Distance-matrix dtypes accepted by the compiled tour_cost
+_KERNEL_DTYPES = (np.dtype(np.int16), np.dtype(np.int32))
+
+
+def int_dist_matrix(dist_matrix, dtype=np.int32) -> np.ndarray:
+    """
+    Contiguous copy of `dist_matrix` with the integer `dtype` of the
+    solver kernels.
+
+    Raises ValueError if a distance is not a whole number (float matrices
+    with whole-number entries are accepted) or does not fit in `dtype`,
+    instead of silently truncating or wrapping it.
+    """
+    dist_matrix = np.asarray(dist_matrix)
+    if not np.issubdtype(dist_matrix.dtype, np.integer):
+        if not (np.issubdtype(dist_matrix.dtype, np.floating)
+                and np.all(np.mod(dist_matrix, 1) == 0)):
+            raise ValueError("dist_matrix must contain integer distances")
+    limits = np.iinfo(dtype)
+    if dist_matrix.size and (dist_matrix.min() < limits.min or dist_matrix.max() > limits.max):
+        raise ValueError(f"dist_matrix entries must fit in {np.dtype(dtype).name}")
+    return np.ascontiguousarray(dist_matrix, dtype=dtype)
+
+
+def compact_dist_matrix(dist_matrix) -> np.ndarray:
+    """
+    Contiguous integer copy of `dist_matrix` for the solver kernels.
+
+    int16 is used when every entry fits (half the memory traffic of the
+    random edge lookups), int32 otherwise. Kernels accumulate in int64.
+    Non-integer distances raise ValueError (see int_dist_matrix).
+    """
+    dist_matrix = np.asarray(dist_matrix)
+    small = np.iinfo(np.int16)
+    if dist_matrix.size and small.min <= dist_matrix.min() and dist_matrix.max() <= small.max:
+        return int_dist_matrix(dist_matrix, np.int16)
+    return int_dist_matrix(dist_matrix, np.int32)
+
+
+def kernel_seed(seed: int | None) -> int:
+    """
+    Seed for the Numba generator of the solver kernels: `seed` itself, or
+    -1 (leave the generator unseeded) for None.
+
+    Numba seeds with a 32-bit value, so anything outside 0 <= seed < 2**32
+    raises ValueError rather than being rejected by NumPy or silently
+    truncated.
+    """
+    if seed is None:
+        return -1
+    if not isinstance(seed, (int, np.integer)) or not 0 <= seed < 2 ** 32:
+        raise ValueError(f"seed must be None or an integer in [0, 2**32), got {seed!r}")
+    return int(seed)
 
 
 def tour_length(tour: List[int], dist_matrix) -> int:
     """
     Compute the length of a Hamiltonian cycle represented by a list of vertex indices.
     The tour is assumed to be a cycle: last vertex connects back to the first.
+
+    Contiguous int16 / int32 distance matrices (as used by the solvers, see
+    compact_dist_matrix) are summed by a compiled Numba loop (see
+    _kernels.tour_cost); other NumPy matrices use a single gather and
+    nested lists are indexed in Python.
     """
+    if len(tour) == 0:
+        return 0
+
+    if isinstance(dist_matrix, np.ndarray):
+        if dist_matrix.dtype in _KERNEL_DTYPES and dist_matrix.flags.c_contiguous:
+            return int(tour_cost(np.ascontiguousarray(tour, dtype=np.int32), dist_matrix))
+        tour = np.asarray(tour)
+        # .item() keeps float distances as floats
+        return (dist_matrix[tour[:-1], tour[1:]].sum() + dist_matrix[tour[-1], tour[0]]).item()
+
+    # Only the closing edge wraps around, so no modulo is needed
     n = len(tour)
-    total = 0
-    for i in range(n):
-        a = tour[i]
-        b = tour[(i + 1) % n]
-        total += dist_matrix[a][b]
+    total = dist_matrix[tour[n - 1]][tour[0]]
+    for i in range(n - 1):
+        total += dist_matrix[tour[i]][tour[i + 1]]
     return total
 
 
+def greedy_nn_tour(dist_matrix: np.ndarray, start: int) -> np.ndarray:
+    """
+    Nearest-neighbor tour: from `start`, repeatedly move to the closest
+    unvisited vertex (ties go to the lowest index).
+    """
+    n = len(dist_matrix)
+    tour = np.empty(n, dtype=np.int32)
+    visited = np.zeros(n, dtype=bool)
+    current = start
+    for k in range(n):
+        tour[k] = current
+        visited[current] = True
+        if k + 1 < n:
+            candidates = np.flatnonzero(~visited)
+            current = candidates[np.argmin(dist_matrix[current, candidates])]
+    return tour
+
+
+# Default length of the 2-opt candidate (nearest-neighbor) lists
+DEFAULT_NEIGHBORS = 20
+
+
+def nearest_neighbors(dist_matrix: np.ndarray, k: int = DEFAULT_NEIGHBORS) -> np.ndarray:
+    """
+    For every vertex, its `k` nearest other vertices, closest first.
+
+    Returns an (n, min(k, n - 1)) int32 array; row v is sorted by
+    dist_matrix[v, :] (ties in index order) and never contains v itself.
+    """
+    n = len(dist_matrix)
+    k = min(k, n - 1)
+    order = np.argsort(dist_matrix, axis=1, kind="stable")
+    others = order[order != np.arange(n)[:, None]].reshape(n, n - 1)
+    return np.ascontiguousarray(others[:, :k], dtype=np.int32)
+
+
+@lru_cache(maxsize=None)
+def _formatted_labels(labels: Tuple[str, ...]) -> Tuple[str, ...]:
+    """The "(label)" string of every vertex, built once per label set."""
+    return tuple(f"({label})" for label in labels)
+
+
 def format_tour(tour: List[int], labels=None) -> str:
     """
     Format a tour as (a)–(b)–...–(a), using given labels or default G_12_66 labels.
     """
     if labels is None:
         labels = vertex_labels_g12
-    return "–".join(f"({labels[i]})" for i in tour) + f"–({labels[tour[0]]})"
+    formatted = _formatted_labels(tuple(labels))
+    return "–".join([formatted[i] for i in tour]) + "–" + formatted[tour[0]]